@@ -0,0 +1,135 @@
+import os
+import sys
+from typing import List, NamedTuple, Optional, Tuple
+
+from position_store import PositionStore
+from tictactoe import AI, EMPTY, HUMAN, solve
+
+DEFAULT_LOG = os.path.join(os.path.expanduser("~"), ".tictactoe_games.log")
+
+Board = List[List[str]]
+Move = Tuple[int, int]
+
+# ================= GAME LOG =================
+# One finished game per line: first player, then cells 1..9 in play order, e.g. "X 5 1 9 3 7"
+
+def log_game(first: str, moves: List[Move], path: str = DEFAULT_LOG) -> bool:
+    cells = " ".join(str(i * 3 + j + 1) for i, j in moves)
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(f"{first} {cells}\n")
+    except OSError as e:
+        print(f"Warning: could not log game to {path} ({e})")
+        return False
+    return True
+
+def parse_game(line: str) -> Tuple[str, List[Move]]:
+    parts = line.split()
+    if not parts or parts[0] not in (HUMAN, AI) or not all(p.isdigit() and 1 <= int(p) <= 9 for p in parts[1:]):
+        raise ValueError(f"malformed game line: {line.strip()!r}")
+    return parts[0], [((int(p) - 1) // 3, (int(p) - 1) % 3) for p in parts[1:]]
+
+# ================= ANALYSIS =================
+
+class MoveReport(NamedTuple):
+    ply: int
+    player: str
+    move: Move
+    best: Optional[Move]  # best move for player in the position before
+    before: int           # AI-perspective value before the move
+    after: int            # AI-perspective value after the move, same scale as before
+    blunder: bool         # move changed the theoretical outcome
+
+def outcome(value: int) -> str:
+    if value > 0:
+        return "O wins"
+    if value < 0:
+        return "X wins"
+    return "draw"
+
+def _sign(v: int) -> int:
+    return (v > 0) - (v < 0)
+
+def analyze_game(first: str, moves: List[Move], store: Optional[PositionStore] = None) -> List[MoveReport]:
+    """
+    Value of every position in the game before and after each move.
+
+    All plies share one store, so the first solve fills it with the whole
+    game tree below the start position and the remaining plies are lookups.
+    """
+    if store is None:
+        store = PositionStore(path=None)
+    b: Board = [[EMPTY] * 3 for _ in range(3)]
+    player = first
+    reports = []
+    best, before = solve(b, player, store)
+    for ply, mv in enumerate(moves, 1):
+        if best is None:
+            raise ValueError(f"Illegal move at ply {ply}: game is already over")
+        if b[mv[0]][mv[1]] != EMPTY:
+            raise ValueError(f"Illegal move at ply {ply}: cell is not empty")
+        b[mv[0]][mv[1]] = player
+        player = HUMAN if player == AI else AI
+        next_best, value = solve(b, player, store)
+        # the child is one ply deeper: shift toward zero to compare with before
+        after = value - 1 if value > 0 else value + 1 if value < 0 else 0
+        reports.append(MoveReport(ply, b[mv[0]][mv[1]], mv, best, before, after,
+                                  _sign(before) != _sign(after)))
+        best, before = next_best, value
+    return reports
+
+def format_analysis(reports: List[MoveReport]) -> str:
+    rows = ["Ply | Player | Move | Best | Before | After"]
+    for r in reports:
+        cell = r.move[0] * 3 + r.move[1] + 1
+        best = r.best[0] * 3 + r.best[1] + 1 if r.best is not None else "-"
+        row = f"{r.ply:>3} | {r.player:^6} | {cell:^4} | {best:^4} | {r.before:>6} | {r.after:>5}"
+        if r.blunder:
+            row += f"  <-- blunder: {outcome(r.before)} -> {outcome(r.after)}"
+        rows.append(row)
+    return "\n".join(rows)
+
+def blunder_summary(reports: List[MoveReport]) -> str:
+    blunders = [r for r in reports if r.blunder]
+    if not blunders:
+        return "No blunders: every move kept the theoretical outcome."
+    return "\n".join(
+        f"Move {r.ply} ({r.player} at {r.move[0]*3+r.move[1]+1}): {outcome(r.before)} -> {outcome(r.after)}"
+        for r in blunders
+    )
+
+# ================= BATCH COMMAND =================
+
+def main(argv: List[str]) -> int:
+    path = argv[1] if len(argv) > 1 else DEFAULT_LOG
+    if not os.path.exists(path):
+        print(f"No game log at {path}")
+        return 1
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Cannot read game log {path} ({e})")
+        return 1
+    store = PositionStore()
+    analyzed = skipped = total = 0
+    for n, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            first, moves = parse_game(line)
+            reports = analyze_game(first, moves, store)
+        except ValueError as e:
+            print(f"\nSkipping {path}:{n}: {e}")
+            skipped += 1
+            continue
+        analyzed += 1
+        total += sum(r.blunder for r in reports)
+        print(f"\nGame {analyzed} (line {n}, {first} first)")
+        print(format_analysis(reports))
+    store.close()
+    print(f"\n{analyzed} game(s) analyzed, {skipped} skipped, {total} blunder(s) found.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,151 @@
+import os
+import sqlite3
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+Board = List[List[str]]
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".tictactoe_positions.db")
+DEFAULT_MAX_ENTRIES = 100_000
+
+# ================= SYMMETRY =================
+# Each permutation maps a canonical cell index k to the original cell perm[k].
+_SYMMETRIES = [
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # identity
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # rotate 90
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # rotate 180
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # rotate 270
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # mirror left/right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # mirror top/bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # anti diagonal
+]
+
+def canonical(b: Board) -> Tuple[str, Tuple[int, ...]]:
+    """Smallest of the 8 symmetric images of b, plus the permutation that produced it."""
+    flat = "".join(cell for row in b for cell in row)
+    best = None
+    best_perm = _SYMMETRIES[0]
+    for perm in _SYMMETRIES:
+        s = "".join(flat[k] for k in perm)
+        if best is None or s < best:
+            best = s
+            best_perm = perm
+    return best, best_perm
+
+# ================= STORE =================
+
+class StoredPosition(NamedTuple):
+    value: int                # AI-perspective score, counted from this position (depth 0)
+    move: Tuple[int, int]     # best move for the side to move, in board coordinates
+    depth: int                # plies searched below this position (always to the end of the game)
+
+class PositionStore:
+    """
+    Solved positions keyed by canonical board + side to move, kept in SQLite.
+
+    The database is opened on first use, rows are read one key at a time and
+    memoized, and new results are written in batches on flush(). If the file
+    cannot be opened or written, the store keeps working in memory for this run.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_PATH, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._memo: Dict[str, Optional[Tuple[int, int, int]]] = {}
+        self._pending: Dict[str, Tuple[int, int, int]] = {}
+
+    @staticmethod
+    def _open(path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path)
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS positions ("
+                "key TEXT PRIMARY KEY, value INTEGER NOT NULL, "
+                "move INTEGER NOT NULL, depth INTEGER NOT NULL)"
+            )
+            # an existing table from something else would pass CREATE IF NOT EXISTS
+            conn.execute("SELECT key, value, move, depth FROM positions LIMIT 1").fetchall()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            try:
+                self._conn = self._open(self.path or ":memory:")
+            except sqlite3.Error as e:
+                # unreadable/corrupt file: keep working for this run only
+                print(f"Warning: position cache {self.path} unusable ({e}); using memory only")
+                self._conn = self._open(":memory:")
+        return self._conn
+
+    def _lookup(self, key: str) -> Optional[Tuple[int, int, int]]:
+        if key not in self._memo:
+            try:
+                row = self._db().execute(
+                    "SELECT value, move, depth FROM positions WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None  # e.g. locked by another run: treat as a miss
+            self._memo[key] = tuple(row) if row else None
+        return self._memo[key]
+
+    def get(self, b: Board, to_move: str) -> Optional[StoredPosition]:
+        canon, perm = canonical(b)
+        hit = self._lookup(canon + to_move)
+        if hit is None:
+            return None
+        value, k, depth = hit
+        m = perm[k]
+        return StoredPosition(value, (m // 3, m % 3), depth)
+
+    def put(self, b: Board, to_move: str, value: int, move: Tuple[int, int], depth: int) -> None:
+        canon, perm = canonical(b)
+        key = canon + to_move
+        row = (value, perm.index(move[0] * 3 + move[1]), depth)
+        self._memo[key] = row
+        self._pending[key] = row
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        db = self._db()
+        try:
+            with db:
+                db.executemany(
+                    "INSERT OR REPLACE INTO positions (key, value, move, depth) VALUES (?, ?, ?, ?)",
+                    [(key,) + row for key, row in self._pending.items()],
+                )
+            if len(self) > self.max_entries:
+                self.compact()
+        except sqlite3.Error as e:
+            # results stay in the memo for this run; they just aren't persisted
+            print(f"Warning: could not write position cache {self.path} ({e})")
+        self._pending.clear()
+
+    def compact(self) -> None:
+        """Trim to 90% of max_entries, dropping positions nearest the end of the game first."""
+        db = self._db()
+        keep = int(self.max_entries * 0.9)
+        with db:
+            db.execute(
+                "DELETE FROM positions WHERE key NOT IN ("
+                "SELECT key FROM positions ORDER BY depth DESC, rowid DESC LIMIT ?)",
+                (keep,),
+            )
+        db.execute("VACUUM")
+        self._memo.clear()
+
+    def __len__(self) -> int:
+        try:
+            return self._db().execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
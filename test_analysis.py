@@ -0,0 +1,43 @@
+import pytest
+
+import analysis
+from analysis import analyze_game, log_game, main, parse_game
+from position_store import PositionStore
+from tictactoe import AI, HUMAN
+
+
+def test_flags_move_that_loses_the_draw():
+    # X: 3, O: 5, X: 1, O: 2, X: 9 lets O complete the middle column
+    first, moves = parse_game("X 3 5 1 2 9 8")
+    reports = analyze_game(first, moves)
+    assert [r.ply for r in reports if r.blunder] == [5]
+    assert reports[4].player == HUMAN
+    assert reports[-1].player == AI and reports[-1].after > 0
+
+
+def test_rejects_moves_after_game_over():
+    first, moves = parse_game("X 3 5 1 2 9 8 7")
+    with pytest.raises(ValueError, match="ply 7"):
+        analyze_game(first, moves)
+
+
+def test_log_game_reports_unwritable_path(tmp_path, capsys):
+    assert not log_game(HUMAN, [(1, 1)], str(tmp_path / "missing" / "games.log"))
+    assert "could not log game" in capsys.readouterr().out
+
+
+def test_batch_skips_bad_lines(tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(analysis, "PositionStore", lambda: PositionStore(path=None))
+    path = tmp_path / "games.log"
+    path.write_text("X 1 5 3 2 8 4 6 9 7\nX 1 1\nnot a game\nX 3 5 1 2 9 8\n")
+    assert main(["analysis.py", str(path)]) == 0
+    out = capsys.readouterr().out
+    assert out.count("Skipping") == 2
+    assert "2 game(s) analyzed, 2 skipped, 1 blunder(s) found." in out
+
+
+def test_batch_reports_unreadable_log(tmp_path, capsys):
+    path = tmp_path / "games.log"
+    path.write_bytes(b"X 1 5 \xff\xfe\n")
+    assert main(["analysis.py", str(path)]) == 1
+    assert "Cannot read game log" in capsys.readouterr().out
@@ -0,0 +1,115 @@
+import random
+import sqlite3
+
+from position_store import PositionStore, _SYMMETRIES, canonical
+from tictactoe import AI, EMPTY, HUMAN, apply_move, available_moves, minimax, new_board, solve
+
+
+def _transform(b, perm):
+    # cell perm[k] of b lands on cell k of the result
+    flat = [cell for row in b for cell in row]
+    return [[flat[perm[i * 3 + j]] for j in range(3)] for i in range(3)]
+
+
+def _random_position(rng, store):
+    b = new_board()
+    player = rng.choice([HUMAN, AI])
+    for _ in range(rng.randint(2, 6)):
+        if solve(b, player, store)[0] is None:
+            break
+        apply_move(b, rng.choice(available_moves(b)), player)
+        player = HUMAN if player == AI else AI
+    return b, player
+
+
+def test_symmetric_images_share_a_key():
+    b = new_board()
+    apply_move(b, (0, 1), HUMAN)
+    apply_move(b, (2, 2), AI)
+    keys = {canonical(_transform(b, perm))[0] for perm in _SYMMETRIES}
+    assert len(keys) == 1
+
+
+def test_move_round_trips_through_every_symmetry():
+    b = new_board()
+    apply_move(b, (0, 0), HUMAN)
+    apply_move(b, (1, 1), AI)
+    apply_move(b, (0, 1), HUMAN)
+    store = PositionStore(path=None)
+    store.put(b, AI, 0, (0, 2), 6)
+
+    for perm in _SYMMETRIES:
+        image = _transform(b, perm)
+        hit = store.get(image, AI)
+        assert hit is not None
+        # the blocking cell (0, 2) must follow the board through the symmetry
+        assert perm[hit.move[0] * 3 + hit.move[1]] == 2
+        assert image[hit.move[0]][hit.move[1]] == EMPTY
+
+
+def test_side_to_move_is_part_of_the_key():
+    store = PositionStore(path=None)
+    store.put(new_board(), HUMAN, 0, (1, 1), 9)
+    assert store.get(new_board(), AI) is None
+
+
+def test_solve_matches_minimax():
+    rng = random.Random(0)
+    store = PositionStore(path=None)
+    for _ in range(200):
+        b, player = _random_position(rng, store)
+        mv, value = solve(b, player, store)
+        if mv is None:
+            continue
+        assert value == minimax(b, 0, player == AI, [0])
+        assert b[mv[0]][mv[1]] == EMPTY
+
+
+def test_store_persists_across_instances(tmp_path):
+    path = str(tmp_path / "positions.db")
+    store = PositionStore(path)
+    solve(new_board(), HUMAN, store)
+    store.close()
+
+    counter = [0]
+    assert solve(new_board(), HUMAN, PositionStore(path), counter) == ((0, 0), 0)
+    assert counter[0] == 1
+
+
+def _depths(store):
+    return sorted((row[0] for row in store._db().execute("SELECT depth FROM positions")), reverse=True)
+
+
+def test_compact_keeps_deepest_positions(tmp_path):
+    full = PositionStore(path=None)
+    solve(new_board(), HUMAN, full)
+    full.flush()
+
+    store = PositionStore(str(tmp_path / "positions.db"), max_entries=100)
+    solve(new_board(), HUMAN, store)
+    store.flush()
+
+    assert len(store) == 90
+    assert _depths(store) == _depths(full)[:90]
+    assert store.get(new_board(), HUMAN).depth == 9
+
+
+def test_corrupt_file_falls_back_to_memory(tmp_path):
+    path = tmp_path / "positions.db"
+    path.write_text("garbage")
+    store = PositionStore(str(path))
+    solve(new_board(), HUMAN, store)
+    store.close()
+    assert path.read_text() == "garbage"
+
+
+def test_foreign_positions_table_falls_back_to_memory(tmp_path):
+    path = str(tmp_path / "positions.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE positions (key TEXT PRIMARY KEY, score INTEGER)")
+    conn.close()
+
+    store = PositionStore(path)
+    assert store.get(new_board(), HUMAN) is None
+    assert solve(new_board(), HUMAN, store)[1] == 0
+    store.close()
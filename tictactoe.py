@@ -1,6 +1,8 @@
 from typing import List, Optional, Tuple
 import time
 
+from position_store import PositionStore
+
 HUMAN = "X"
 AI = "O"
 EMPTY = " "
@@ -114,7 +116,7 @@ def minimax(b: Board, depth: int, is_maximizing: bool, counter: List[int]) -> in
                 best = val
         return best
 
-def best_move_minimax(b: Board) -> Tuple[Tuple[int, int], int, float]:
+def best_move_minimax(b: Board) -> Tuple[Tuple[int, int], int, int, float]:
     counter = [0]
     t0 = time.perf_counter()
 
@@ -132,7 +134,7 @@ def best_move_minimax(b: Board) -> Tuple[Tuple[int, int], int, float]:
 
     t1 = time.perf_counter()
     assert best_mv is not None
-    return best_mv, counter[0], (t1 - t0)
+    return best_mv, best_val, counter[0], (t1 - t0)
 
 # ---------- ALPHA-BETA ----------
 def alphabeta(b: Board, depth: int, is_maximizing: bool, alpha: int, beta: int, counter: List[int]) -> int:
@@ -163,7 +165,7 @@ def alphabeta(b: Board, depth: int, is_maximizing: bool, alpha: int, beta: int,
                 break  # prune
         return value
 
-def best_move_alphabeta(b: Board) -> Tuple[Tuple[int, int], int, float]:
+def best_move_alphabeta(b: Board) -> Tuple[Tuple[int, int], int, int, float]:
     counter = [0]
     t0 = time.perf_counter()
 
@@ -185,7 +187,45 @@ def best_move_alphabeta(b: Board) -> Tuple[Tuple[int, int], int, float]:
 
     t1 = time.perf_counter()
     assert best_mv is not None
-    return best_mv, counter[0], (t1 - t0)
+    return best_mv, best_val, counter[0], (t1 - t0)
+
+# ---------- STORE-BACKED SOLVER ----------
+def solve(b: Board, to_move: str, store: PositionStore,
+          counter: Optional[List[int]] = None) -> Tuple[Optional[Tuple[int, int]], int]:
+    """
+    Exact value of b (terminal_score with depth 0 at b) and the best move for
+    to_move. Positions are read from and written to store, so a position that
+    was solved before, or any symmetric copy of it, costs one lookup.
+    Returns (None, score) when b is already terminal.
+    """
+    if counter is None:
+        counter = [0]
+    counter[0] += 1
+
+    ts = terminal_score(b, 0)
+    if ts is not None:
+        return None, ts
+
+    hit = store.get(b, to_move)
+    if hit is not None:
+        return hit.move, hit.value
+
+    is_maximizing = to_move == AI
+    best_mv = None
+    best = -10_000 if is_maximizing else 10_000
+    moves = available_moves(b)
+    for mv in moves:
+        apply_move(b, mv, to_move)
+        _, child = solve(b, HUMAN if is_maximizing else AI, store, counter)
+        undo_move(b, mv)
+        # one ply further from b: same shift terminal_score applies per depth
+        val = child - 1 if child > 0 else child + 1 if child < 0 else 0
+        if (is_maximizing and val > best) or (not is_maximizing and val < best):
+            best = val
+            best_mv = mv
+
+    store.put(b, to_move, best, best_mv, len(moves))
+    return best_mv, best
 
 # ---------- UTILS ----------
 def algo_choice() -> str:
@@ -197,24 +237,39 @@ def algo_choice() -> str:
             return "alphabeta"
         print("Please enter 1 or 2.")
 
-def ai_play(b: Board, algo: str) -> None:
+def ai_play(b: Board, algo: str, store: Optional[PositionStore] = None) -> Tuple[int, int]:
+    hit = store.get(b, AI) if store is not None else None
+
     # For project comparison: we can also compute BOTH metrics every AI turn (optional)
     if algo == "minimax":
-        mv, nodes, sec = best_move_minimax(b)
+        mv, val, nodes, sec = best_move_minimax(b)
         name = "Minimax"
     else:
-        mv, nodes, sec = best_move_alphabeta(b)
+        mv, val, nodes, sec = best_move_alphabeta(b)
         name = "Alpha-Beta"
 
     print(f"\nAI ({name}) plays: {mv[0]*3+mv[1]+1}")
     print(f"Nodes evaluated: {nodes}")
     print(f"Time: {sec*1000:.3f} ms")
+    if hit is not None:
+        # the stored move may be a different, equally good cell; only report the value
+        print(f"Position cache: value {hit.value} (depth {hit.depth}); move above is from the search")
+    elif store is not None:
+        # both searches are full-depth, so the root value is exact
+        store.put(b, AI, val, mv, len(available_moves(b)))
+        store.flush()
     apply_move(b, mv, AI)
+    return mv
 
 def main_cli():
+    # imported here: analysis builds on this module
+    from analysis import analyze_game, format_analysis, log_game
+
     b = new_board()
     current = HUMAN  # human starts
+    moves: List[Tuple[int, int]] = []
     algo = algo_choice()
+    store = PositionStore()  # opened lazily on the first AI turn
 
     print("\nTic-Tac-Toe (X=Human, O=AI)")
     print(f"AI algorithm: {algo}\n")
@@ -229,14 +284,19 @@ def main_cli():
                 print("\nAI wins!")
             else:
                 print("\nDraw!")
+            print("\nPost-game analysis (values from O's side):")
+            print(format_analysis(analyze_game(HUMAN, moves, store)))
+            log_game(HUMAN, moves)
+            store.close()
             break
 
         if current == HUMAN:
             mv = human_input_move(b)
             apply_move(b, mv, HUMAN)
+            moves.append(mv)
             current = AI
         else:
-            ai_play(b, algo)
+            moves.append(ai_play(b, algo, store))
             current = HUMAN
 
 if __name__ == "__main__":
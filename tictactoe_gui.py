@@ -3,6 +3,9 @@ from tkinter import messagebox
 import time
 from typing import List, Tuple, Optional
 
+from analysis import analyze_game, blunder_summary, format_analysis, log_game
+from position_store import PositionStore
+
 HUMAN = "X"
 AI = "O"
 EMPTY = " "
@@ -92,7 +95,7 @@ def minimax(b: Board, depth: int, is_max: bool, counter: List[int]) -> int:
             best = min(best, val)
         return best
 
-def best_move_minimax(b: Board) -> Tuple[Tuple[int, int], int, float]:
+def best_move_minimax(b: Board) -> Tuple[Tuple[int, int], int, int, float]:
     counter = [0]
     t0 = time.perf_counter()
 
@@ -107,7 +110,7 @@ def best_move_minimax(b: Board) -> Tuple[Tuple[int, int], int, float]:
             best_mv = mv
 
     t1 = time.perf_counter()
-    return best_mv, counter[0], (t1 - t0)
+    return best_mv, best_val, counter[0], (t1 - t0)
 
 # ================= ALPHA-BETA =================
 
@@ -138,7 +141,7 @@ def alphabeta(b: Board, depth: int, is_max: bool, alpha: int, beta: int, counter
                 break
         return value
 
-def best_move_alphabeta(b: Board) -> Tuple[Tuple[int, int], int, float]:
+def best_move_alphabeta(b: Board) -> Tuple[Tuple[int, int], int, int, float]:
     counter = [0]
     t0 = time.perf_counter()
 
@@ -156,7 +159,7 @@ def best_move_alphabeta(b: Board) -> Tuple[Tuple[int, int], int, float]:
         alpha = max(alpha, best_val)
 
     t1 = time.perf_counter()
-    return best_mv, counter[0], (t1 - t0)
+    return best_mv, best_val, counter[0], (t1 - t0)
 
 # ================= GUI =================
 
@@ -170,12 +173,15 @@ class TicTacToeGUI:
         self.board = new_board()
         self.buttons = [[None]*3 for _ in range(3)]
         self.game_started = False
+        self.store = PositionStore()  # opened lazily on the first AI turn
 
         self.algorithm = tk.StringVar(value="alphabeta")
         self.ai_starts = tk.BooleanVar(value=False)
 
         self.last_human: Optional[Tuple[int, int]] = None
         self.last_ai: Optional[Tuple[int, int]] = None
+        self.moves: List[Tuple[int, int]] = []
+        self.analysis_win: Optional[tk.Toplevel] = None
 
         # --------- Header ---------
         header = tk.Frame(self.root, bg=BG)
@@ -249,7 +255,7 @@ class TicTacToeGUI:
         self.reset_btn.pack(side="left")
 
         exit_btn = tk.Button(
-            btnrow, text="Exit", command=self.root.destroy,
+            btnrow, text="Exit", command=self.close,
             bg="#7f1d1d", fg=TXT, activebackground="#991b1b", activeforeground=TXT,
             relief="flat", padx=10, pady=6
         )
@@ -286,8 +292,13 @@ class TicTacToeGUI:
         )
         legend.grid(row=2, column=0, columnspan=3, padx=12, pady=(0, 12), sticky="w")
 
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         self.enable_board_for_human()
 
+    def close(self):
+        self.store.close()
+        self.root.destroy()
+
     # ---------- option lock/unlock ----------
     def lock_options(self):
         self.rb_minimax.config(state=tk.DISABLED)
@@ -306,6 +317,7 @@ class TicTacToeGUI:
         self.unlock_options()
         self.last_human = None
         self.last_ai = None
+        self.moves = []
 
         self.status.config(text="Choose options then play (Human = X)")
         self.ai_move_label.config(text="AI move: -")
@@ -364,17 +376,40 @@ class TicTacToeGUI:
             for j in range(3):
                 self.buttons[i][j].config(state=(tk.NORMAL if self.board[i][j] == EMPTY else tk.DISABLED))
 
+    def show_analysis(self, reports):
+        # full per-move table (values before/after each move) in its own window
+        if self.analysis_win is not None and self.analysis_win.winfo_exists():
+            self.analysis_win.destroy()
+        self.analysis_win = tk.Toplevel(self.root, bg=PANEL)
+        self.analysis_win.title("Post-game analysis")
+
+        text = format_analysis(reports)
+        lines = text.splitlines()
+        box = tk.Text(
+            self.analysis_win, width=max(len(line) for line in lines), height=len(lines),
+            fg=TXT, bg=CARD, font=("Consolas", 10), relief="flat", padx=8, pady=8
+        )
+        box.insert("1.0", text)
+        box.config(state=tk.DISABLED)
+        box.pack(padx=12, pady=12)
+
     def check_end(self) -> bool:
         w = winner(self.board)
         if w or is_full(self.board):
             if w == HUMAN:
-                messagebox.showinfo("Result", "You win! (X)")
+                result = "You win! (X)"
             elif w == AI:
-                messagebox.showinfo("Result", "AI wins! (O)")
+                result = "AI wins! (O)"
             else:
-                messagebox.showinfo("Result", "Draw!")
+                result = "Draw!"
             self.disable_board()
             self.status.config(text="Game over. Press Reset / New Game.")
+            # post-game analysis: one store-backed solve, the remaining plies are lookups
+            first = self.board[self.moves[0][0]][self.moves[0][1]]
+            reports = analyze_game(first, self.moves, self.store)
+            self.show_analysis(reports)
+            messagebox.showinfo("Result", f"{result}\n\nPost-game analysis:\n{blunder_summary(reports)}")
+            log_game(first, self.moves)
             return True
         return False
 
@@ -385,26 +420,37 @@ class TicTacToeGUI:
             self.check_end()
             return
 
+        hit = self.store.get(self.board, AI)
+
         # Compare BOTH algorithms on the same state
-        mm_mv, mm_nodes, mm_t = best_move_minimax(self.board)
-        ab_mv, ab_nodes, ab_t = best_move_alphabeta(self.board)
+        mm_mv, mm_val, mm_nodes, mm_t = best_move_minimax(self.board)
+        ab_mv, ab_val, ab_nodes, ab_t = best_move_alphabeta(self.board)
 
         chosen_name = "Minimax" if self.algorithm.get() == "minimax" else "Alpha-Beta"
         chosen_mv = mm_mv if self.algorithm.get() == "minimax" else ab_mv
+        chosen_val = mm_val if self.algorithm.get() == "minimax" else ab_val
+        compare_text = (
+            f"Minimax    | Nodes: {mm_nodes:<6} | Time: {mm_t*1000:>8.3f} ms\n"
+            f"Alpha-Beta | Nodes: {ab_nodes:<6} | Time: {ab_t*1000:>8.3f} ms"
+        )
+
+        if hit is not None:
+            # the stored move may be a different, equally good cell; only report the value
+            compare_text += f"\nCache      | Value: {hit.value:<6} | Depth: {hit.depth}"
+        else:
+            # both searches are full-depth, so the root value is exact
+            self.store.put(self.board, AI, chosen_val, chosen_mv, len(available_moves(self.board)))
+            self.store.flush()
 
         apply_move(self.board, chosen_mv, AI)
         self.last_ai = chosen_mv
+        self.moves.append(chosen_mv)
         self.update_ui()
 
         k = chosen_mv[0] * 3 + chosen_mv[1] + 1
         self.ai_move_label.config(text=f"AI move ({chosen_name}): {k}")
 
-        self.compare_label.config(
-            text=(
-                f"Minimax    | Nodes: {mm_nodes:<6} | Time: {mm_t*1000:>8.3f} ms\n"
-                f"Alpha-Beta | Nodes: {ab_nodes:<6} | Time: {ab_t*1000:>8.3f} ms"
-            )
-        )
+        self.compare_label.config(text=compare_text)
 
         if not self.check_end():
             self.status.config(text="Your turn (X)")
@@ -438,6 +484,7 @@ class TicTacToeGUI:
 
         apply_move(self.board, (i, j), HUMAN)
         self.last_human = (i, j)
+        self.moves.append((i, j))
         self.update_ui()
 
         if self.check_end():